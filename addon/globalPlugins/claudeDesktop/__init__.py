@@ -11,25 +11,42 @@ then focuses the response when complete.
 Note: Claude Desktop is an Electron app. Its content is rendered in a
 Chromium webview, so some UI elements may not be fully exposed via
 Windows UI Automation. This plugin uses multiple strategies:
-1. UIA tree traversal for status detection
-2. Live region event monitoring for dynamic updates
-3. Deeper traversal to find web content elements
+1. Live region and name change events for immediate status updates
+2. UIA tree traversal as a slower fallback for status detection
+3. A single cached UIA search over the web content elements
 """
 
+import array
+from collections import deque
+from functools import reduce
+import re
+import sys
 import threading
 import time
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Set
 import weakref
 
+from comtypes import COMObject
+
+try:
+	import wx
+except ImportError:
+	# Not running inside NVDA, e.g. when the module is imported for inspection
+	wx = None
+
 import api
 import appModuleHandler
 import controlTypes
 import eventHandler
 import globalPluginHandler
 import speech
+import UIAHandler
 import ui
+import winUser
+from comInterfaces import UIAutomationClient as UIAClient
 from logHandler import log
 from NVDAObjects import NVDAObject
+from NVDAObjects.IAccessible import getNVDAObjectFromEvent
 from NVDAObjects.UIA import UIA
 
 
@@ -37,55 +54,409 @@ from NVDAObjects.UIA import UIA
 CLAUDE_WINDOW_CLASS = "Chrome_WidgetWin_1"
 CLAUDE_WINDOW_TITLE = "Claude"
 
-# Action keywords that appear in inline action indicators
-ACTION_KEYWORDS = [
+# Keywords that appear in status and inline action indicators, by category:
+# "main" marks Claude's main status, "action" an inline action indicator
+KEYWORD_CATEGORIES = {
 	# Status indicators
-	"thinking", "generating", "typing", "processing",
-	"loading", "waiting", "sending", "responding",
-	"claude is", "stop",
+	"thinking": "main", "generating": "main", "typing": "main", "processing": "main",
+	"loading": "action", "waiting": "action", "sending": "action", "responding": "action",
+	"claude is": "action", "stop": "main",
 	# Action indicators (for tool use)
-	"reading", "writing", "searching", "running",
-	"analyzing", "creating", "editing", "executing",
-	"fetching", "downloading", "uploading",
-]
+	"reading": "action", "writing": "action", "searching": "action", "running": "action",
+	"analyzing": "action", "creating": "action", "editing": "action", "executing": "action",
+	"fetching": "action", "downloading": "action", "uploading": "action",
+}
+ACTION_KEYWORDS = list(KEYWORD_CATEGORIES)
+
+# Scan intervals in seconds: fast while generating, backing off while idle
+POLL_INTERVAL_GENERATING = 0.1
+POLL_INTERVAL_IDLE = 2.0
+POLL_INTERVAL_NO_WINDOW = 5.0
+# Longest time between full scans while no UIA events arrive, in case some were missed
+FULL_SCAN_INTERVAL = 5.0
+# Failed window lookups in a row before switching to POLL_INTERVAL_NO_WINDOW
+MAX_MISSING_WINDOW_SCANS = 3
+
+# Names shorter than this cannot contain any keyword
+_MIN_KEYWORD_LENGTH = min(len(kw) for kw in KEYWORD_CATEGORIES)
+
+
+def _compile_keyword_matcher() -> "re.Pattern[str]":
+	"""Compile KEYWORD_CATEGORIES into one case-insensitive pattern.
+
+	Each category becomes a named group, so a match tells its category through
+	Match.lastgroup without any table lookup or lowercasing of the name.
+	"""
+	keywords_by_category: dict[str, list[str]] = {}
+	for keyword, category in KEYWORD_CATEGORIES.items():
+		keywords_by_category.setdefault(category, []).append(re.escape(keyword))
+	return re.compile(
+		"|".join(
+			f"(?P<{category}>{'|'.join(keywords)})"
+			for category, keywords in keywords_by_category.items()
+		),
+		re.IGNORECASE,
+	)
+
+
+# All keywords compiled into one alternation, so each name is scanned once
+_KEYWORD_RE = _compile_keyword_matcher()
+
+# Control types of window children whose subtrees never contain status info
+_PRUNED_CONTROL_TYPES = (
+	UIAClient.UIA_TitleBarControlTypeId,
+	UIAClient.UIA_MenuBarControlTypeId,
+	UIAClient.UIA_ScrollBarControlTypeId,
+	UIAClient.UIA_SeparatorControlTypeId,
+)
+
+# PropertyConditionFlags_MatchSubstring, supported since Windows 10 1809
+_MATCH_SUBSTRING = 2
+
+# UIA conditions and cache request used to find status elements, built once
+_status_query = None
+
+
+def _create_name_condition(client):
+	"""Create a condition matching names that contain any of ACTION_KEYWORDS.
+
+	The substring match runs inside UIAutomationCore, so elements whose names
+	contain no keyword never reach Python. Falls back to matching any named
+	element where substring matching is not supported.
+	"""
+	try:
+		flags = UIAClient.PropertyConditionFlags_IgnoreCase | _MATCH_SUBSTRING
+		return reduce(client.CreateOrCondition, [
+			client.CreatePropertyConditionEx(UIAClient.UIA_NamePropertyId, keyword, flags)
+			for keyword in ACTION_KEYWORDS
+		])
+	except Exception as e:
+		log.debugWarning(f"Substring name conditions not supported: {e}")
+		return client.CreateNotCondition(client.CreatePropertyCondition(UIAClient.UIA_NamePropertyId, ""))
+
+
+def _get_status_query():
+	"""Get the (child_condition, condition, cache_request) triple for the status search.
+
+	child_condition selects the window children worth searching, skipping
+	off-screen panes and window chrome. condition matches elements named after
+	a keyword, progress bars and live regions (including visually hidden ones),
+	so a single FindAll call per searched child replaces walking the whole tree.
+	Name, control type and live setting are cached on the results so reading
+	them stays in-process.
+	"""
+	global _status_query
+	if _status_query is None:
+		handler = UIAHandler.handler
+		client = handler.clientObject
+		on_screen = client.CreatePropertyCondition(UIAClient.UIA_IsOffscreenPropertyId, False)
+		pruned = reduce(client.CreateOrCondition, [
+			client.CreatePropertyCondition(UIAClient.UIA_ControlTypePropertyId, control_type)
+			for control_type in _PRUNED_CONTROL_TYPES
+		])
+		child_condition = client.CreateAndCondition(on_screen, client.CreateNotCondition(pruned))
+		conditions = [
+			_create_name_condition(client),
+			client.CreatePropertyCondition(
+				UIAClient.UIA_ControlTypePropertyId, UIAClient.UIA_ProgressBarControlTypeId
+			),
+			client.CreatePropertyCondition(UIAClient.UIA_LiveSettingPropertyId, UIAClient.Polite),
+			client.CreatePropertyCondition(UIAClient.UIA_LiveSettingPropertyId, UIAClient.Assertive),
+		]
+		condition = reduce(client.CreateOrCondition, conditions)
+		# Start from NVDA's base request so matches can be wrapped as NVDAObjects
+		cache_request = handler.baseCacheRequest.Clone()
+		cache_request.AddProperty(UIAClient.UIA_NamePropertyId)
+		cache_request.AddProperty(UIAClient.UIA_ControlTypePropertyId)
+		cache_request.AddProperty(UIAClient.UIA_LiveSettingPropertyId)
+		_status_query = (child_condition, condition, cache_request)
+	return _status_query
+
+
+# UIA condition and cache request used to find top-level Claude windows, built once
+_window_query = None
+
+
+def _get_window_query():
+	"""Get the (condition, cache_request) pair for the top-level window search.
+
+	Window class is matched by UIA and the name and window handle are cached,
+	so checking every top-level window takes one cross-process call.
+	"""
+	global _window_query
+	if _window_query is None:
+		client = UIAHandler.handler.clientObject
+		condition = client.CreatePropertyCondition(UIAClient.UIA_ClassNamePropertyId, CLAUDE_WINDOW_CLASS)
+		cache_request = client.CreateCacheRequest()
+		cache_request.AddProperty(UIAClient.UIA_NamePropertyId)
+		cache_request.AddProperty(UIAClient.UIA_NativeWindowHandlePropertyId)
+		_window_query = (condition, cache_request)
+	return _window_query
+
+
+# Control types that hold a whole response
+_RESPONSE_CONTROL_TYPES = (UIAClient.UIA_DocumentControlTypeId, UIAClient.UIA_EditControlTypeId)
+
+# UIA cache request used while searching for the response, built once
+_response_cache_request = None
+
+
+def _get_response_cache_request():
+	"""Get the cache request holding what the response search checks on each element."""
+	global _response_cache_request
+	if _response_cache_request is None:
+		# Start from NVDA's base request so matches can be wrapped as NVDAObjects
+		cache_request = UIAHandler.handler.baseCacheRequest.Clone()
+		cache_request.AddProperty(UIAClient.UIA_NamePropertyId)
+		cache_request.AddProperty(UIAClient.UIA_ControlTypePropertyId)
+		cache_request.AddProperty(UIAClient.UIA_IsKeyboardFocusablePropertyId)
+		_response_cache_request = cache_request
+	return _response_cache_request
+
+
+def _iter_children(element, cache_request):
+	"""Yield the children of a UIA element, fetching each sibling only when needed.
+
+	Unlike NVDAObject.children, nothing is fetched for siblings after the one
+	the caller stops at.
+	"""
+	walker = UIAHandler.handler.baseTreeWalker
+	child = walker.GetFirstChildElementBuildCache(element, cache_request)
+	while child:
+		yield child
+		child = walker.GetNextSiblingElementBuildCache(child, cache_request)
+
+
+# NVDAObject wrappers of status elements by runtime ID, alive as long as something uses them.
+# Only used from the monitor thread: reused wrappers are mutated in place.
+_wrapper_cache: "weakref.WeakValueDictionary[tuple[int, ...], UIA]" = weakref.WeakValueDictionary()
+
+
+def _wrap(element) -> UIA:
+	"""Wrap a status element as an NVDAObject, reusing the wrapper of an earlier scan.
+
+	A reused wrapper gets the new element, so it sees the freshly cached properties.
+	Monitor thread only; objects handed to NVDA's focus get fresh wrappers instead.
+	"""
+	rid = tuple(element.GetRuntimeId())
+	obj = _wrapper_cache.get(rid)
+	if obj is None:
+		obj = UIA(UIAElement=element)
+		_wrapper_cache[rid] = obj
+	else:
+		obj.UIAElement = element
+		obj.invalidateCache()
+	return obj
+
+
+class _UIAEventHandler(COMObject):
+	"""Receives UIA events raised inside the Claude Desktop window.
+
+	NVDA's own event plumbing can drop live region changes coming from the
+	Chromium webview, so the status monitor subscribes to them directly.
+	Structure changes tell the monitor the window needs to be scanned again.
+	"""
+
+	_com_interfaces_ = [
+		UIAClient.IUIAutomationEventHandler,
+		UIAClient.IUIAutomationStructureChangedEventHandler,
+	]
+
+	def __init__(self, monitor: "StatusMonitor"):
+		super().__init__()
+		self._monitor = weakref.ref(monitor)
+
+	def IUIAutomationEventHandler_HandleAutomationEvent(self, sender, eventID):
+		monitor = self._monitor()
+		if monitor is None:
+			return
+		try:
+			monitor.queue_status_text(sender.CachedName)
+		except Exception as e:
+			log.debugWarning(f"Error handling UIA event: {e}")
+
+	def IUIAutomationStructureChangedEventHandler_HandleStructureChangedEvent(self, sender, changeType, runtimeId):
+		monitor = self._monitor()
+		if monitor is not None:
+			monitor.invalidate()
 
 
 class StatusMonitor:
 	"""Monitors Claude Desktop for status changes and response completion."""
 
+	# Fixed attribute layout for the attributes read on every tick.
+	# __weakref__ is needed because _UIAEventHandler holds a weak reference.
+	__slots__ = (
+		"_plugin", "_stop_event", "_thread",
+		"_last_status", "_last_actions", "_was_generating",
+		"_current_interval", "_missing_window_scans",
+		"_cached_hwnd", "_status_elements", "_last_response_rid",
+		"_last_scan", "_dirty", "_last_full_scan",
+		"_event_statuses", "_wake_event",
+		"_pending", "_pending_lock", "_flush_scheduled",
+		"_event_hwnd", "_event_element", "_event_handler",
+		"__weakref__",
+	)
+
 	def __init__(self, plugin: "GlobalPlugin"):
 		self._plugin = weakref.ref(plugin)
-		self._running = False
+		self._stop_event = threading.Event()
 		self._thread: Optional[threading.Thread] = None
 		self._last_status: Optional[str] = None
-		self._last_actions: Set[str] = set()
+		self._last_actions: FrozenSet[str] = frozenset()
 		self._was_generating = False
-		self._poll_interval = 0.3  # seconds - faster polling for action updates
+		self._current_interval = POLL_INTERVAL_IDLE
+		self._missing_window_scans = 0
+		self._cached_hwnd: int = 0
+		# Wrappers found by the last scan, kept alive so the next scan can reuse them
+		self._status_elements: list[tuple[NVDAObject, str]] = []
+		# UIA runtime ID of the response container focused after the last completion
+		self._last_response_rid: Optional[tuple[int, ...]] = None
+		self._last_scan = 0.0
+		# Set when the Claude window may have changed since the last full scan
+		self._dirty = True
+		self._last_full_scan = 0.0
+		# Status texts pushed from NVDA and UIA events, drained by the monitor thread
+		self._event_statuses: deque[str] = deque(maxlen=32)
+		self._wake_event = threading.Event()
+		# Messages waiting to be spoken in one batch on the main thread
+		self._pending: list[str] = []
+		self._pending_lock = threading.Lock()
+		self._flush_scheduled = False
+		self._event_hwnd = 0
+		self._event_element = None
+		self._event_handler: Optional[_UIAEventHandler] = None
 
 	def start(self):
 		"""Start the status monitoring thread."""
-		if self._running:
+		if self._thread:
 			return
-		self._running = True
+		self._stop_event.clear()
 		self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
 		self._thread.start()
 		log.debug("Claude Desktop status monitor started")
 
 	def stop(self):
 		"""Stop the status monitoring thread."""
-		self._running = False
+		self._stop_event.set()
+		# Interrupt the wait so the thread exits right away
+		self._wake_event.set()
 		if self._thread:
 			self._thread.join(timeout=2.0)
 			self._thread = None
+		self._unregister_uia_events()
 		log.debug("Claude Desktop status monitor stopped")
 
+	def queue_status_text(self, text: Optional[str]):
+		"""Queue a status text reported by an event (thread-safe)."""
+		if not text:
+			return
+		self._event_statuses.append(text)
+		self._dirty = True
+		self._wake_event.set()
+
+	def invalidate(self):
+		"""Mark the Claude window as changed so the next tick scans it (thread-safe)."""
+		self._dirty = True
+
+	def _get_uia_element(self, obj: NVDAObject):
+		"""Get the UIA element for the given object, if UIA is available."""
+		if isinstance(obj, UIA):
+			return obj.UIAElement
+		handler = UIAHandler.handler
+		if handler and obj.windowHandle:
+			return handler.clientObject.ElementFromHandle(obj.windowHandle)
+		return None
+
+	def _register_uia_events(self, window: NVDAObject):
+		"""Subscribe to live region and structure changes of the given Claude window."""
+		hwnd = window.windowHandle
+		if hwnd == self._event_hwnd:
+			return
+		self._unregister_uia_events()
+		handler = UIAHandler.handler
+		if not handler:
+			return
+		try:
+			element = self._get_uia_element(window)
+			if element is None:
+				return
+			cache_request = handler.clientObject.CreateCacheRequest()
+			cache_request.AddProperty(UIAClient.UIA_NamePropertyId)
+			uia_event_handler = _UIAEventHandler(self)
+			self._event_element = element
+			self._event_handler = uia_event_handler
+			handler.clientObject.AddAutomationEventHandler(
+				UIAClient.UIA_LiveRegionChangedEventId,
+				element,
+				UIAClient.TreeScope_Subtree,
+				cache_request,
+				uia_event_handler,
+			)
+			handler.clientObject.AddStructureChangedEventHandler(
+				element,
+				UIAClient.TreeScope_Subtree,
+				None,
+				uia_event_handler,
+			)
+			# Only trust the dirty flag once both subscriptions are in place
+			self._event_hwnd = hwnd
+		except Exception as e:
+			log.debugWarning(f"Error registering UIA events: {e}")
+
+	def _unregister_uia_events(self):
+		"""Remove the UIA event subscription, if any."""
+		if self._event_handler is None:
+			return
+		handler = UIAHandler.handler
+		# UIAHandler may already be torn down when NVDA exits
+		if handler:
+			client = handler.clientObject
+			try:
+				client.RemoveAutomationEventHandler(
+					UIAClient.UIA_LiveRegionChangedEventId,
+					self._event_element,
+					self._event_handler,
+				)
+			except Exception as e:
+				log.debugWarning(f"Error unregistering UIA events: {e}")
+			try:
+				client.RemoveStructureChangedEventHandler(self._event_element, self._event_handler)
+			except Exception as e:
+				log.debugWarning(f"Error unregistering UIA events: {e}")
+		self._event_hwnd = 0
+		self._event_element = None
+		self._event_handler = None
+
 	def _get_claude_window(self) -> Optional[NVDAObject]:
+		"""Get the Claude Desktop window, reusing the last found window handle."""
+		try:
+			if self._cached_hwnd and winUser.isWindow(self._cached_hwnd):
+				# Usually Claude is in the foreground, and NVDA already has that object
+				fg = api.getForegroundObject()
+				if fg and fg.windowHandle == self._cached_hwnd:
+					return fg
+				window = getNVDAObjectFromEvent(self._cached_hwnd, winUser.OBJID_CLIENT, 0)
+				if window:
+					return window
+		except Exception as e:
+			log.debugWarning(f"Error getting cached Claude window: {e}")
+		# The cached window is gone (or was never found), enumerate again
+		self._cached_hwnd = 0
+		window = self._find_claude_window()
+		if window:
+			self._cached_hwnd = window.windowHandle
+		return window
+
+	def _find_claude_window(self) -> Optional[NVDAObject]:
 		"""Find the Claude Desktop window."""
 		try:
 			fg = api.getForegroundObject()
 			if fg and self._is_claude_window(fg):
 				return fg
 			# Check if Claude is open but not focused
+			if UIAHandler.handler:
+				return self._find_claude_window_uia()
 			desktop = api.getDesktopObject()
 			if desktop:
 				for child in desktop.children:
@@ -95,8 +466,20 @@ class StatusMonitor:
 			log.debugWarning(f"Error finding Claude window: {e}")
 		return None
 
+	def _find_claude_window_uia(self) -> Optional[NVDAObject]:
+		"""Find the Claude Desktop window among the top-level windows via UIA."""
+		condition, cache_request = _get_window_query()
+		root = UIAHandler.handler.clientObject.GetRootElement()
+		found = root.FindAllBuildCache(UIAClient.TreeScope_Children, condition, cache_request)
+		for index in range(found.Length):
+			element = found.GetElement(index)
+			name = element.CachedName or ""
+			if CLAUDE_WINDOW_TITLE.lower() in name.lower():
+				return getNVDAObjectFromEvent(element.CachedNativeWindowHandle, winUser.OBJID_CLIENT, 0)
+		return None
+
 	def _is_claude_window(self, obj: NVDAObject) -> bool:
-		"""Check if the given object is the Claude Desktop window."""
+		"""Check if the given top-level object is the Claude Desktop window."""
 		try:
 			if obj.windowClassName == CLAUDE_WINDOW_CLASS:
 				name = obj.name or ""
@@ -105,51 +488,81 @@ class StatusMonitor:
 			pass
 		return False
 
-	def _find_status_elements(self, root: NVDAObject) -> list[NVDAObject]:
-		"""Find status indicator elements in Claude Desktop."""
+	def _find_status_elements(self, root: NVDAObject) -> list[tuple[NVDAObject, str]]:
+		"""Find status indicator elements in Claude Desktop.
+
+		Returns:
+			List of (element, category) tuples, see _classify_status
+		"""
 		status_elements = []
 		try:
-			# Use deeper traversal for Electron apps
-			self._traverse_for_status(root, status_elements, max_depth=25)
+			element = self._get_uia_element(root)
+			if element is None:
+				return status_elements
+			child_condition, condition, cache_request = _get_status_query()
+			# Prune window chrome and off-screen panes before searching their subtrees
+			children = element.FindAll(UIAClient.TreeScope_Children, child_condition)
+			for child_index in range(children.Length):
+				# One cross-process call for the whole subtree of each remaining child
+				found = children.GetElement(child_index).FindAllBuildCache(
+					UIAClient.TreeScope_Subtree, condition, cache_request
+				)
+				for index in range(found.Length):
+					match = found.GetElement(index)
+					category = self._classify_element(match)
+					if category:
+						# Only wrap matches as NVDAObjects
+						status_elements.append((_wrap(match), category))
 		except Exception as e:
 			log.debugWarning(f"Error finding status elements: {e}")
 		return status_elements
 
-	def _traverse_for_status(self, obj: NVDAObject, results: list, depth: int = 0, max_depth: int = 25):
-		"""Recursively traverse the UI tree looking for status indicators."""
-		if depth > max_depth:
-			return
-
-		try:
-			# Look for text elements that might contain status info
-			name = obj.name or ""
-			role = obj.role
-
-			name_lower = name.lower()
-			for keyword in ACTION_KEYWORDS:
-				if keyword in name_lower:
-					results.append(obj)
-					break
-
-			# Also check for progress indicators
-			if role in (controlTypes.Role.PROGRESSBAR, controlTypes.Role.ANIMATION):
-				results.append(obj)
-
-			# Check for live regions (common in web apps for status updates)
-			try:
-				if hasattr(obj, 'UIAElement') and obj.UIAElement:
-					live_setting = obj.UIAElement.CurrentLiveSetting
-					if live_setting and live_setting > 0:  # 1=polite, 2=assertive
-						results.append(obj)
-			except Exception:
-				pass
-
-			# Traverse children
-			for child in obj.children or []:
-				self._traverse_for_status(child, results, depth + 1, max_depth)
+	def _classify_element(self, element) -> Optional[str]:
+		"""Classify a UIA element by its cached properties, see _classify_status."""
+		# Look for text elements that might contain status info
+		category = self._classify_status(element.CachedName or "")
+		if category:
+			return category
+
+		# Also check for progress indicators
+		if element.CachedControlType == UIAClient.UIA_ProgressBarControlTypeId:
+			return "action"
+
+		# Check for live regions (common in web apps for status updates)
+		live_setting = element.CachedLiveSetting
+		if live_setting and live_setting > 0:  # 1=polite, 2=assertive
+			return "action"
+		return None
 
-		except Exception as e:
-			log.debugWarning(f"Error traversing UI tree: {e}")
+	def _classify_status(self, name: str) -> Optional[str]:
+		"""Classify a status text as "main", "action" or None if unrelated."""
+		if len(name) < _MIN_KEYWORD_LENGTH:
+			return None
+		category = None
+		for match in _KEYWORD_RE.finditer(name):
+			category = match.lastgroup
+			if category == "main":
+				break
+		return category
+
+	def _process_event_statuses(self):
+		"""Announce status texts queued by events since the last iteration."""
+		while self._event_statuses:
+			name = self._event_statuses.popleft()
+			category = self._classify_status(name)
+			if category == "main":
+				if name != self._last_status:
+					self._speak_status(name)
+					self._last_status = name
+			elif category == "action":
+				if name not in self._last_actions:
+					self._speak_status(name)
+					self._last_actions = self._last_actions | {sys.intern(name)}
+			else:
+				continue
+			# Scan soon to confirm; only a scan sets the generating state, so an
+			# event for an element the scan cannot see never fakes a completion
+			self._current_interval = POLL_INTERVAL_GENERATING
 
 	def _get_current_status(self, window: NVDAObject) -> tuple[Optional[str], Set[str]]:
 		"""Get the current status and active actions from Claude Desktop.
@@ -158,71 +571,114 @@ class StatusMonitor:
 			Tuple of (main_status, set_of_action_names)
 		"""
 		status_elements = self._find_status_elements(window)
+		self._status_elements = status_elements
 		main_status = None
 		actions: Set[str] = set()
 
-		for elem in status_elements:
+		for elem, category in status_elements:
 			try:
 				name = elem.name
 				if name:
 					# Check if this is a main status indicator
-					name_lower = name.lower()
-					if any(kw in name_lower for kw in ["thinking", "generating", "stop"]):
+					if category == "main":
 						main_status = name
 					else:
 						# It's an action indicator
-						actions.add(name)
+						actions.add(sys.intern(name))
 			except Exception:
 				pass
 
 		return main_status, actions
 
 	def _is_generating(self, status: Optional[str], actions: Set[str]) -> bool:
-		"""Check if Claude is currently generating a response."""
-		if status:
-			status_lower = status.lower()
-			if any(kw in status_lower for kw in ["thinking", "generating", "typing", "processing", "stop"]):
-				return True
+		"""Check if Claude is currently generating a response.
+
+		status is only set for elements already classified as main status, so no
+		keyword matching is needed here.
+		"""
 		# Also consider it generating if there are active actions
-		return len(actions) > 0
+		return status is not None or len(actions) > 0
 
 	def _focus_response(self, window: NVDAObject):
 		"""Focus the response area after generation completes."""
 		try:
+			# Try the container that held the last response before searching the tree
+			if self._focus_cached_response(window):
+				return
+			element = self._get_uia_element(window)
+			if element is None:
+				# Intentionally no NVDAObject fallback: without UIA the status search
+				# cannot run either, so generation completion is never detected.
+				log.debugWarning("UIA unavailable, cannot focus the response")
+				return
+			cache_request = _get_response_cache_request()
 			# Try to find and focus the latest response
-			self._find_and_focus_response(window)
+			self._find_and_focus_response(element.BuildUpdatedCache(cache_request), cache_request)
 		except Exception as e:
 			log.debugWarning(f"Error focusing response: {e}")
 
-	def _find_and_focus_response(self, root: NVDAObject, depth: int = 0, max_depth: int = 15):
-		"""Find the response content area and focus it."""
+	def _focus_object(self, obj: UIA):
+		"""Focus the given response object and move the navigator to it."""
+		obj.setFocus()
+		# Move to the beginning of the response
+		api.setNavigatorObject(obj)
+		speech.speakObject(obj, reason=controlTypes.OutputReason.FOCUS)
+		try:
+			self._last_response_rid = tuple(obj.UIAElement.GetRuntimeId())
+		except Exception as e:
+			log.debugWarning(f"Error getting runtime ID: {e}")
+			self._last_response_rid = None
+
+	def _focus_cached_response(self, window: NVDAObject) -> bool:
+		"""Focus the response container found after the last completion, if still present."""
+		handler = UIAHandler.handler
+		if self._last_response_rid is None or not handler:
+			return False
+		try:
+			element = self._get_uia_element(window)
+			if element is None:
+				return False
+			condition = handler.clientObject.CreatePropertyCondition(
+				UIAClient.UIA_RuntimeIdPropertyId, array.array("l", self._last_response_rid)
+			)
+			found = element.FindFirstBuildCache(UIAClient.TreeScope_Descendants, condition, handler.baseCacheRequest)
+			if not found:
+				# The container is gone, fall back to searching the tree
+				self._last_response_rid = None
+				return False
+			obj = UIA(UIAElement=found)
+			if not obj.isFocusable:
+				return False
+			self._focus_object(obj)
+			return True
+		except Exception as e:
+			log.debugWarning(f"Error focusing cached response: {e}")
+		return False
+
+	def _find_and_focus_response(self, element, cache_request, depth: int = 0, max_depth: int = 15) -> bool:
+		"""Find the response content area below the given UIA element and focus it.
+
+		Elements are checked through their cached properties; only the match is
+		wrapped as an NVDAObject.
+		"""
 		if depth > max_depth:
 			return False
 
 		try:
-			# Look for document or text areas that might contain the response
-			role = root.role
-			if role in (controlTypes.Role.DOCUMENT, controlTypes.Role.EDITABLETEXT):
-				# Try to focus this element
-				if root.isFocusable:
-					root.setFocus()
-					# Move to the beginning of the response
-					api.setNavigatorObject(root)
-					speech.speakObject(root, reason=controlTypes.OutputReason.FOCUS)
-					return True
-
-			# Also look for group elements that might be message containers
-			name = root.name or ""
-			if "message" in name.lower() or "response" in name.lower():
-				if root.isFocusable:
-					root.setFocus()
-					api.setNavigatorObject(root)
-					speech.speakObject(root, reason=controlTypes.OutputReason.FOCUS)
+			if element.CachedIsKeyboardFocusable:
+				# Look for document or text areas that might contain the response
+				is_response = element.CachedControlType in _RESPONSE_CONTROL_TYPES
+				if not is_response:
+					# Also look for group elements that might be message containers
+					name = (element.CachedName or "").lower()
+					is_response = "message" in name or "response" in name
+				if is_response:
+					self._focus_object(UIA(UIAElement=element))
 					return True
 
-			# Traverse children
-			for child in root.children or []:
-				if self._find_and_focus_response(child, depth + 1, max_depth):
+			# Traverse children, stopping at the first one that holds the response
+			for child in _iter_children(element, cache_request):
+				if self._find_and_focus_response(child, cache_request, depth + 1, max_depth):
 					return True
 
 		except Exception as e:
@@ -231,52 +687,126 @@ class StatusMonitor:
 		return False
 
 	def _monitor_loop(self):
-		"""Main monitoring loop."""
-		while self._running:
-			try:
-				window = self._get_claude_window()
-				if window:
-					current_status, current_actions = self._get_current_status(window)
-					is_generating = self._is_generating(current_status, current_actions)
-
-					# Announce main status changes
-					if current_status and current_status != self._last_status:
-						self._speak_status(current_status)
-						self._last_status = current_status
+		"""Main monitoring loop.
 
-					# Announce new actions (e.g., "Reading file...", "Searching...")
-					new_actions = current_actions - self._last_actions
-					for action in new_actions:
-						self._speak_status(action)
-
-					self._last_actions = current_actions
-
-					# Check if generation just completed
-					if self._was_generating and not is_generating:
-						# Generation completed - focus the response
-						self._on_generation_complete(window)
-
-					self._was_generating = is_generating
+		Event-driven status texts are handled as soon as they arrive; the full
+		UI tree scan runs on an interval adapted to Claude's activity.
+		"""
+		while not self._stop_event.is_set():
+			timeout = self._last_scan + self._current_interval - time.monotonic()
+			if timeout > 0:
+				self._wake_event.wait(timeout)
+				self._wake_event.clear()
+			if self._stop_event.is_set():
+				break
 
+			try:
+				self._process_event_statuses()
+				if time.monotonic() - self._last_scan >= self._current_interval:
+					self._last_scan = time.monotonic()
+					self._scan()
 			except Exception as e:
 				log.debugWarning(f"Error in monitor loop: {e}")
 
-			time.sleep(self._poll_interval)
+	def _is_unchanged(self) -> bool:
+		"""Check whether the Claude window has not changed since the last full scan.
+
+		Only trusted while the structure change subscription covers the cached
+		window, and never for longer than FULL_SCAN_INTERVAL. Never trusted while
+		Claude is generating: status texts then change in place, which raises
+		name changes rather than structure changes.
+		"""
+		if self._was_generating:
+			return False
+		if self._dirty or not self._event_hwnd or self._event_hwnd != self._cached_hwnd:
+			return False
+		if time.monotonic() - self._last_full_scan >= FULL_SCAN_INTERVAL:
+			return False
+		return bool(winUser.isWindow(self._event_hwnd))
+
+	def _scan(self):
+		"""Scan the Claude Desktop window for status changes."""
+		if self._is_unchanged():
+			# Skipped ticks still back off, or an idle window would keep fast ticks
+			self._update_interval(self._was_generating)
+			return
+		window = self._get_claude_window()
+		if not window:
+			self._missing_window_scans += 1
+			if self._missing_window_scans >= MAX_MISSING_WINDOW_SCANS:
+				self._current_interval = POLL_INTERVAL_NO_WINDOW
+			else:
+				self._update_interval(False)
+			return
+		self._missing_window_scans = 0
+		self._register_uia_events(window)
+		self._dirty = False
+		self._last_full_scan = time.monotonic()
+		current_status, current_actions = self._get_current_status(window)
+		is_generating = self._is_generating(current_status, current_actions)
+
+		# Announce main status changes
+		if current_status and current_status != self._last_status:
+			self._speak_status(current_status)
+			self._last_status = current_status
+
+		# Announce new actions (e.g., "Reading file...", "Searching...")
+		new_actions = current_actions - self._last_actions
+		for action in new_actions:
+			self._speak_status(action)
+
+		self._last_actions = frozenset(current_actions)
+
+		# Check if generation just completed
+		if self._was_generating and not is_generating:
+			# Generation completed - focus the response
+			self._on_generation_complete(window)
+
+		self._was_generating = is_generating
+		self._update_interval(is_generating)
+
+	def _update_interval(self, is_generating: bool):
+		"""Scan quickly while Claude is busy, back off gradually once idle."""
+		if is_generating:
+			self._current_interval = POLL_INTERVAL_GENERATING
+		else:
+			self._current_interval = min(POLL_INTERVAL_IDLE, self._current_interval * 1.5)
 
 	def _speak_status(self, status: str):
-		"""Speak a status message (thread-safe)."""
+		"""Queue a status message to be spoken (thread-safe).
+
+		Messages queued before the main thread gets to them are spoken together.
+		"""
+		if wx is None:
+			return
 		try:
+			with self._pending_lock:
+				self._pending.append(status)
+				if self._flush_scheduled:
+					return
+				self._flush_scheduled = True
 			# Use wx.CallAfter to ensure we're on the main thread
-			import wx
-			wx.CallAfter(ui.message, status)
+			wx.CallAfter(self._flush_pending)
 		except Exception as e:
+			self._flush_scheduled = False
 			log.debugWarning(f"Error speaking status: {e}")
 
+	def _flush_pending(self):
+		"""Speak all queued status messages at once (main thread)."""
+		with self._pending_lock:
+			pending = self._pending
+			self._pending = []
+			self._flush_scheduled = False
+		# Drop consecutive repeats of the same message
+		messages = [msg for index, msg in enumerate(pending) if index == 0 or msg != pending[index - 1]]
+		if messages:
+			ui.message("; ".join(messages))
+
 	def _on_generation_complete(self, window: NVDAObject):
 		"""Called when Claude finishes generating a response."""
+		if wx is None:
+			return
 		try:
-			import wx
-
 			def _announce_and_focus():
 				# Translators: Announced when Claude finishes generating a response
 				ui.message(_("Response complete"))
@@ -311,9 +841,34 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			log.debugWarning(f"Error in gainFocus event: {e}")
 		nextHandler()
 
+	def event_liveRegionChange(self, obj: NVDAObject, nextHandler):
+		"""Forward live region updates from Claude Desktop to the status monitor."""
+		self._queue_event_status(obj)
+		nextHandler()
+
+	def event_nameChange(self, obj: NVDAObject, nextHandler):
+		"""Forward name changes from Claude Desktop to the status monitor."""
+		self._queue_event_status(obj)
+		nextHandler()
+
+	def _queue_event_status(self, obj: NVDAObject):
+		"""Queue the name of a Claude Desktop object as a status update."""
+		try:
+			if self._is_claude_desktop(obj):
+				self._status_monitor.queue_status_text(obj.name)
+		except Exception as e:
+			log.debugWarning(f"Error queuing event status: {e}")
+
 	def _is_claude_desktop(self, obj: NVDAObject) -> bool:
 		"""Check if the focused object is part of Claude Desktop."""
 		try:
+			hwnd = obj.windowHandle
+			if hwnd:
+				# Resolve the top-level window with plain Win32 calls, no UIA round trips
+				root = winUser.getAncestor(hwnd, winUser.GA_ROOT)
+				if winUser.getClassName(root) != CLAUDE_WINDOW_CLASS:
+					return False
+				return CLAUDE_WINDOW_TITLE.lower() in winUser.getWindowText(root).lower()
 			# Walk up the parent chain to find the top-level window
 			current = obj
 			for _ in range(20):  # Limit depth to avoid infinite loops
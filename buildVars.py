@@ -55,14 +55,15 @@ and focusing responses when they complete."""),
 # or use glob expressions.
 # For example to include all files with a ".py" extension from the "globalPlugins" dir of your add-on
 # the list can be written as follows:
-pythonSources: list[str] = ["addon/globalPlugins/**/*.py"]
+pythonSources: list[str] = ["addon/globalPlugins/claudeDesktop/__init__.py"]
 
 # Files that contain strings for translation. Usually your python sources
 i18nSources: list[str] = pythonSources + ["buildVars.py"]
 
 # Files that will be ignored when building the nvda-addon file
 # Paths are relative to the addon directory, not to the root directory of your addon sources.
-excludedFiles: list[str] = []
+# Never ship a legacy single-file copy of the plugin alongside the claudeDesktop package.
+excludedFiles: list[str] = ["globalPlugins/claudeDesktop.py"]
 
 # Base language for the NVDA add-on
 baseLanguage: str = "en"